@@ -19,10 +19,10 @@ class AddressBook(UserDict):
         :param args: the contact records (Record, optional)
         """
         super().__init__()
-        # Add contact records if given, removing duplicates
+        # Add contact records if given, removing duplicates (the first record wins)
+        data = self.data
         for contact in args:
-            if str(contact.name) not in self:
-                self.add_record(contact)
+            data.setdefault(contact.name._key, contact)
 
     def find(self, name: str) -> Record:
         """ Search and return the contact record, or raise the contact not found exception
@@ -30,30 +30,30 @@ class AddressBook(UserDict):
         :param name: contact name (string, mandatory)
         :return: contact record, if found (Record)
         """
-        if name not in self:
-            # Contact found - raise the contact not found exception
-            raise ContactNotFound
+        contact = self.data.get(name)
+        if contact is None:
+            # Contact not found - raise the contact not found exception
+            raise ContactNotFound()
         # Return the contact
-        return self.get(name, None)
+        return contact
 
     def add_record(self, contact: Record) -> None:
         """ Add the contact record, or raise the contact already exists exception
 
         :param contact: contact record (Record, mandatory)
         """
-        if str(contact.name) in self:
+        key = contact.name._key
+        if key in self.data:
             # Contact found - raise the contact already exists exception
             raise ContactAlreadyExist()
         # Add the contact
-        self.data[str(contact.name)] = contact
+        self.data[key] = contact
 
     def delete(self, name: str) -> None:
         """ Remove the contact record, or raise the contact not found exception
 
         :param name: contact name (string, mandatory)
         """
-        if name not in self:
-            # Contact found - raise the contact not found exception
+        if self.data.pop(name, None) is None:
+            # Contact not found - raise the contact not found exception
             raise ContactNotFound()
-        # Remove the contact
-        self.pop(name, None)
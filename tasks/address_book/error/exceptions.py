@@ -21,49 +21,67 @@ class ObjectValueError(Exception):
 
 
 class ContactNotFound(ObjectNotFound):
+    message = "The contact not found"
+
     def __init__(self):
-        super().__init__("The contact not found")
+        Exception.__init__(self, self.message)
 
 
 class ContactAlreadyExist(ObjectAlreadyExist):
+    message = "The contact already exists"
+
     def __init__(self):
-        super().__init__("The contact already exists")
+        Exception.__init__(self, self.message)
 
 
 class ContactNameMandatory(ObjectValueError):
+    message = "The contact name is required"
+
     def __init__(self):
-        super().__init__("The contact name is required")
+        Exception.__init__(self, self.message)
 
 
 class ContactPhoneNotFound(ObjectNotFound):
+    message = "The contact phone number not found"
+
     def __init__(self):
-        super().__init__("The contact phone number not found")
+        Exception.__init__(self, self.message)
 
 
 class ContactPhoneAlreadyExist(ObjectAlreadyExist):
+    message = "The contact phone number already exists"
+
     def __init__(self):
-        super().__init__("The contact phone number already exists")
+        Exception.__init__(self, self.message)
 
 
 class ContactPhoneValueError(ObjectValueError):
+    message = (
+        "The contact phone number must consist of exactly ten digits " \
+        "and must not contain any letters or other characters, " \
+        "except for phone number formatting symbols"
+    )
+
     def __init__(self):
-        super().__init__(
-            "The contact phone number must consist of exactly ten digits " \
-            "and must not contain any letters or other characters, " \
-            "except for phone number formatting symbols"
-        )
+        Exception.__init__(self, self.message)
 
 
 class ContactEmailNotFound(ObjectNotFound):
+    message = "The contact email not found"
+
     def __init__(self):
-        super().__init__("The contact email not found")
+        Exception.__init__(self, self.message)
 
 
 class ContactEmailAlreadyExist(ObjectAlreadyExist):
+    message = "The contact email already exists"
+
     def __init__(self):
-        super().__init__("The contact email already exists")
+        Exception.__init__(self, self.message)
 
 
 class ContactEmailValueError(ObjectValueError):
+    message = "The contact email must be a valid email address"
+
     def __init__(self):
-        super().__init__("The contact email must be a valid email address")
+        Exception.__init__(self, self.message)
@@ -5,6 +5,7 @@ Record class for address book implementation
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -19,7 +20,13 @@ from ..error import (
 )
 
 
+# Phone number formatting symbols to be cleared
+_PHONE_STRIP = b'()-'
+
+
 class Field:
+    __slots__ = ('value',)
+
     def __init__(self, value: str):
         """ Initialize the field with the specified value
 
@@ -35,6 +42,8 @@ class Field:
         return str(self.value)
 
 class Name(Field):
+    __slots__ = ('_key',)
+
     def __init__(self, value: str):
         """ Initialize the Name field with the specified value
 
@@ -44,10 +53,11 @@ class Name(Field):
         if not value:
             raise ContactNameMandatory()
         super().__init__(value)
+        # The address book key for the contact
+        self._key = str(value)
 
 class Phone(Field):
-    value_clear_pattern = re.compile(r"[()-]|\s")
-    value_match_pattern = re.compile(r"^\d{10}$")
+    __slots__ = ()
 
     def __init__(self, value: str):
         """ Initialize the Phone number field with the specified value
@@ -56,8 +66,9 @@ class Phone(Field):
         """
         super().__init__(self.prepare(value))
 
-    @classmethod
-    def prepare(cls, value: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def prepare(value: str) -> str:
         """ Phone number validation and sanitization
 
         :param value: phone number (string, mandatory)
@@ -67,17 +78,22 @@ class Phone(Field):
         # Check whether the phone number is empty or None
         if not value:
             raise ContactPhoneValueError()
-        # Clear the phone number from formatting symbols and whitespaces
-        value = re.sub(cls.value_clear_pattern, '', value)
-        # Verify the phone number
-        if not re.match(cls.value_match_pattern, value):
+        # Clear the phone number from whitespaces, including non-ASCII ones
+        value = "".join(value.split())
+        # Check whether the phone number contains non-ASCII characters
+        if not value.isascii():
             raise ContactPhoneValueError()
-        return value
+        # Clear the phone number from formatting symbols
+        prepared = value.encode('ascii').translate(None, _PHONE_STRIP)
+        # Verify the phone number - exactly ten digits
+        if len(prepared) != 10 or not prepared.isdigit():
+            raise ContactPhoneValueError()
+        return prepared.decode('ascii')
 
 
 class Email(Field):
-    value_clear_pattern = re.compile(r"\s")
-    value_match_pattern = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    __slots__ = ()
+    value_match_pattern = re.compile(r"[a-zA-Z0-9_.+\-]+@[a-zA-Z0-9\-]+\.[a-zA-Z0-9\-.]+", re.ASCII)
 
     def __init__(self, value: str):
         """ Initialize the Email field with the specified value
@@ -86,8 +102,9 @@ class Email(Field):
         """
         super().__init__(self.prepare(value))
 
-    @classmethod
-    def prepare(cls, value: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def prepare(value: str) -> str:
         """ Email number validation and sanitization
 
         :param value: email (string, mandatory)
@@ -98,14 +115,16 @@ class Email(Field):
         if not value:
             raise ContactEmailValueError()
         # Clear the email from whitespaces
-        value = re.sub(cls.value_clear_pattern, '', value)
+        value = "".join(value.split())
         # Verify the email
-        if not re.match(cls.value_match_pattern, value):
+        if not Email.value_match_pattern.fullmatch(value):
             raise ContactEmailValueError()
         return value
 
 
 class Record:
+    __slots__ = ('name', 'phones', 'emails')
+
     def __init__(self, name: str, phones: Optional[list[str]] = None, emails: Optional[list[str]] = None):
         """ Initialize the Contact record for the specified Name and with Phone numbers oe Emails, if given
 
@@ -114,18 +133,19 @@ class Record:
         :param emails: the emails (list of strings, optional)
         """
         self.name = Name(name)
-        self.phones = []
-        self.emails = []
+        # Phone numbers and emails are indexed by the sanitized value, preserving the insertion order
+        self.phones: dict[str, Phone] = {}
+        self.emails: dict[str, Email] = {}
         # Add phone numbers if given, removing duplicates
         if isinstance(phones, list):
             for phone in phones:
-                if self.__find_phone(phone) is None:
-                    self.add_phone(phone)
+                phone_object = Phone(phone)
+                self.phones.setdefault(phone_object.value, phone_object)
         # Add emails if given, removing duplicates
         if isinstance(emails, list):
             for email in emails:
-                if self.__find_email(email) is None:
-                    self.add_email(email)
+                email_object = Email(email)
+                self.emails.setdefault(email_object.value, email_object)
 
     def __find_phone(self, phone: str) -> Optional[Phone]:
         """ Private method for searching the phone number
@@ -133,10 +153,8 @@ class Record:
         :param phone: phone number (string, mandatory)
         :return: phone field, if found (Phone, optional)
         """
-        # Clear the phone number from formatting symbols and whitespaces
-        phone = Phone.prepare(phone)
-        # Find and return by phone number
-        return next((p for p in self.phones if p.value == phone), None)
+        # Clear the phone number from formatting symbols and whitespaces, find and return by phone number
+        return self.phones.get(Phone.prepare(phone))
 
     def __find_email(self, email: str) -> Optional[Email]:
         """ Private method for searching the email
@@ -144,10 +162,8 @@ class Record:
         :param email: email (string, mandatory)
         :return: email field, if found (Email, optional)
         """
-        # Clear the email fom whitespaces
-        email = Email.prepare(email)
-        # Find and return by email
-        return next((p for p in self.emails if p.value == email), None)
+        # Clear the email fom whitespaces, find and return by email
+        return self.emails.get(Email.prepare(email))
 
     def find_phone(self, phone: str) -> Phone:
         """ Search and return the phone number, or raise the phone number not found exception
@@ -167,34 +183,52 @@ class Record:
 
         :param phone: phone number (string, mandatory)
         """
-        if self.__find_phone(phone):
+        phone_object = Phone(phone)
+        if phone_object.value in self.phones:
             # Phone number found - raise the phone number already exists exception
             raise ContactPhoneAlreadyExist()
         # Add the phone number
-        self.phones.append(Phone(phone))
+        self.phones[phone_object.value] = phone_object
 
     def remove_phone(self, phone: str) -> None:
         """ Remove the phone number, or raise the phone number not found exception
 
         :param phone: phone number (string, mandatory)
         """
-        self.phones.remove(self.find_phone(phone))
+        if self.phones.pop(Phone.prepare(phone), None) is None:
+            # Phone number not found - raise the phone number not found exception
+            raise ContactPhoneNotFound()
 
     def edit_phone(self, existing_phone: str, phone: str) -> None:
-        """ Edit the phone number, or raise the phone number not found exception
+        """ Edit the phone number, or raise the phone number not found or the new phone number already exists exception
+        The changed phone number is moved to the end of the phone numbers
 
         :param existing_phone: phone number (string, mandatory)
         :param phone: new phone number (string, mandatory)
         """
-        self.phones[self.phones.index(self.find_phone(existing_phone))] = Phone(phone)
+        key = Phone.prepare(existing_phone)
+        if key not in self.phones:
+            # Phone number not found - raise the phone number not found exception
+            raise ContactPhoneNotFound()
+        phone_object = Phone(phone)
+        if phone_object.value == key:
+            # The phone number is unchanged - replace the field, keeping its position
+            self.phones[key] = phone_object
+            return
+        # The phone number is changed - add the new one at the end, unless it already exists
+        if self.phones.setdefault(phone_object.value, phone_object) is not phone_object:
+            # New phone number found - raise the phone number already exists exception
+            raise ContactPhoneAlreadyExist()
+        # Remove the existing phone number
+        del self.phones[key]
 
-    def find_email(self, email: str) -> Phone:
+    def find_email(self, email: str) -> Email:
         """ Search and return the email, or raise the email not found exception
 
         :param email: email (string, mandatory)
         :return: email field, if found (Email)
         """
-        email_object: Optional[Phone] = self.__find_email(email)
+        email_object: Optional[Email] = self.__find_email(email)
         if email_object is None:
             # Email not found - raise the email not found exception
             raise ContactEmailNotFound()
@@ -206,26 +240,44 @@ class Record:
 
         :param email: email (string, mandatory)
         """
-        if self.__find_email(email):
+        email_object = Email(email)
+        if email_object.value in self.emails:
             # Email found - raise the email already exists exception
             raise ContactEmailAlreadyExist()
         # Add the email
-        self.emails.append(Email(email))
+        self.emails[email_object.value] = email_object
 
     def remove_email(self, email: str) -> None:
         """ Remove the email, or raise the email not found exception
 
         :param email: email (string, mandatory)
         """
-        self.emails.remove(self.find_email(email))
+        if self.emails.pop(Email.prepare(email), None) is None:
+            # Email not found - raise the email not found exception
+            raise ContactEmailNotFound()
 
     def edit_email(self, existing_email: str, email: str) -> None:
-        """ Edit the email, or raise the email not found exception
+        """ Edit the email, or raise the email not found or the new email already exists exception
+        The changed email is moved to the end of the emails
 
         :param existing_email: email (string, mandatory)
         :param email: new email (string, mandatory)
         """
-        self.emails[self.emails.index(self.find_email(existing_email))] = Email(email)
+        key = Email.prepare(existing_email)
+        if key not in self.emails:
+            # Email not found - raise the email not found exception
+            raise ContactEmailNotFound()
+        email_object = Email(email)
+        if email_object.value == key:
+            # The email is unchanged - replace the field, keeping its position
+            self.emails[key] = email_object
+            return
+        # The email is changed - add the new one at the end, unless it already exists
+        if self.emails.setdefault(email_object.value, email_object) is not email_object:
+            # New email found - raise the email already exists exception
+            raise ContactEmailAlreadyExist()
+        # Remove the existing email
+        del self.emails[key]
 
 
     def __str__(self) -> str:
@@ -235,6 +287,6 @@ class Record:
         """
         return "Contact name: {name}, phones: {phones}, emails: {emails}".format(
             name=self.name.value,
-            phones="; ".join(p.value for p in self.phones),
-            emails="; ".join(p.value for p in self.emails),
+            phones="; ".join(p.value for p in self.phones.values()),
+            emails="; ".join(p.value for p in self.emails.values()),
         )
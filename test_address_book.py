@@ -2,105 +2,257 @@
 
 """
 Tests for AddressBook and Record classes
+
+Each test builds its own address book, so the tests are independent and can run in parallel (pytest -n auto)
 """
 
+import sys
+
+import pytest
+
 from tasks.address_book import AddressBook, Record
+from tasks.address_book.error import (
+    ContactNotFound,
+    ContactPhoneNotFound,
+    ContactPhoneAlreadyExist,
+    ContactPhoneValueError,
+    ContactEmailNotFound,
+    ContactEmailAlreadyExist,
+    ContactEmailValueError,
+)
 
 
-def main():
-    try:
+JOHN_RECORD = "Contact name: John, phones: 1234567890; 5555555555; 1112223344, emails: john@test.com"
+JANE_RECORD = "Contact name: Jane, phones: 9876543210, emails: jane@test.com"
 
-        print("#" * 20, "  Test 1  ", "#" * 20)
 
-        # Create an address book
-        book = AddressBook()
+def _dump(book: AddressBook) -> None:
+    """ Print all records in the address book with a single write
 
-        # Create a record for John
-        john_record = Record("John")
-        john_record.add_phone("1234567890")
-        john_record.add_phone("5555555555")
-        john_record.add_phone("(111) 222 33-44")
-        john_record.add_email("john@test.com")
-        # Add John's record to the address book
-        book.add_record(john_record)
+    :param book: address book (AddressBook, mandatory)
+    """
+    if book.data:
+        sys.stdout.write("\n".join(map(str, book.data.values())) + "\n")
 
-        # Create a record for Jane
-        jane_record = Record("Jane")
-        jane_record.add_phone("9876543210")
-        jane_record.add_email("jane@test.com")
-        # Add Jane's record to the address book
-        book.add_record(jane_record)
 
-        # Print all records in the address book
-        for name, record in book.data.items():
-            print(record)
+def _create_book() -> AddressBook:
+    """ Create the address book with John's and Jane's records
 
-        print("#" * 20, "  Test 2  ", "#" * 20)
+    :return: address book (AddressBook)
+    """
+    # Create an address book
+    book = AddressBook()
 
-        # Find John's record and edit the phone number
-        john = book.find("John")
-        john.edit_phone("1234567890", "1112223333")
-        john.edit_email("john@test.com", "john.john@test.com")
-        # Print John's record
-        print(john)
+    # Create a record for John, including phone numbers and emails
+    john_record = Record(
+        "John",
+        phones=["1234567890", "5555555555", "(111) 222 33-44"],
+        emails=["john@test.com"],
+    )
+    # Add John's record to the address book
+    book.add_record(john_record)
 
-        # Find the specific phone number in John's record
-        found_phone = john.find_phone("5555555555")
-        # Print John's phone number
-        print(f"{john.name}: {found_phone}")
+    # Create a record for Jane
+    jane_record = Record("Jane")
+    jane_record.add_phone("9876543210")
+    jane_record.add_email("jane@test.com")
+    # Add Jane's record to the address book
+    book.add_record(jane_record)
 
-        # Find the specific email in John's record
-        found_email = john.find_email("john.john@test.com")
-        # Print John's email
-        print(f"{john.name}: {found_email}")
+    return book
 
 
-        print("#" * 20, "  Test 3  ", "#" * 20)
+def test_add_records(capsys):
+    # Print all records in the address book
+    _dump(_create_book())
 
-        # Delete Jane's record
-        book.delete("Jane")
+    assert capsys.readouterr().out == f"{JOHN_RECORD}\n{JANE_RECORD}\n"
 
-        # Print all records in the address book
-        for name, record in book.data.items():
-            print(record)
 
-        print("#" * 20, "  Test 4  ", "#" * 20)
+def test_edit_and_find(capsys):
+    book = _create_book()
 
-        # Create a new record for Jane, including phone numbers and emails, and add it to the address book
-        book.add_record(
-            Record(
-                "Jane",
-                phones=["1111111111", "2222222222", "1111111111"],
-                emails=["jane@test.com", "jane@test.com", "jane.jane@test.com"],
-            )
-        )
+    # Find John's record and edit the phone number
+    john = book.find("John")
+    john.edit_phone("1234567890", "1112223333")
+    john.edit_email("john@test.com", "john.john@test.com")
+    # Print John's record
+    print(john)
+
+    # Find the specific phone number in John's record
+    found_phone = john.find_phone("5555555555")
+    # Print John's phone number
+    print(john.name, found_phone, sep=": ")
+
+    # Find the specific email in John's record
+    found_email = john.find_email("john.john@test.com")
+    # Print John's email
+    print(john.name, found_email, sep=": ")
+
+    assert capsys.readouterr().out == (
+        "Contact name: John, phones: 5555555555; 1112223344; 1112223333, emails: john.john@test.com\n"
+        "John: 5555555555\n"
+        "John: john.john@test.com\n"
+    )
+
+
+def test_delete_record(capsys):
+    book = _create_book()
+
+    # Delete Jane's record
+    book.delete("Jane")
+
+    # Print all records in the address book
+    _dump(book)
+
+    assert capsys.readouterr().out == f"{JOHN_RECORD}\n"
 
-        # Print all records in the address book
-        for name, record in book.data.items():
-            print(record)
-
-        print("#" * 20, "  Test 5  ", "#" * 20)
-
-        # Create the new address book with John's and Jane's records
-        book = AddressBook(
-            Record("John", phones=["1234567890"], emails=["john@test.com"]),
-            Record(
-                "Jane",
-                phones=["1111111111", "2222222222", "1111111111"],
-                emails=["jane@test.com", "jane@test.com", "jane.jane@test.com"],
-            ),
-            Record("John", phones=["1234567890", "5555555555"])
+
+def test_add_record_with_duplicates(capsys):
+    book = _create_book()
+    book.delete("Jane")
+
+    # Create a new record for Jane, including phone numbers and emails, and add it to the address book
+    book.add_record(
+        Record(
+            "Jane",
+            phones=["1111111111", "2222222222", "1111111111"],
+            emails=["jane@test.com", "jane@test.com", "jane.jane@test.com"],
         )
+    )
+
+    # Print all records in the address book
+    _dump(book)
+
+    assert capsys.readouterr().out == (
+        f"{JOHN_RECORD}\n"
+        "Contact name: Jane, phones: 1111111111; 2222222222, emails: jane@test.com; jane.jane@test.com\n"
+    )
+
+
+def test_create_book_with_duplicates(capsys):
+    # Create the new address book with John's and Jane's records
+    book = AddressBook(
+        Record("John", phones=["1234567890"], emails=["john@test.com"]),
+        Record(
+            "Jane",
+            phones=["1111111111", "2222222222", "1111111111"],
+            emails=["jane@test.com", "jane@test.com", "jane.jane@test.com"],
+        ),
+        Record("John", phones=["1234567890", "5555555555"])
+    )
+
+    # Print all records in the address book
+    _dump(book)
+
+    assert capsys.readouterr().out == (
+        "Contact name: John, phones: 1234567890, emails: john@test.com\n"
+        "Contact name: Jane, phones: 1111111111; 2222222222, emails: jane@test.com; jane.jane@test.com\n"
+    )
+
+
+def test_errors():
+    book = _create_book()
+
+    with pytest.raises(ContactNotFound):
+        book.find("Bob")
+    with pytest.raises(ContactPhoneValueError):
+        book.find("John").add_phone("12345")
+    with pytest.raises(ContactPhoneAlreadyExist):
+        book.find("John").edit_phone("1234567890", "555-555-5555")
+
+
+def test_phone_unicode_whitespace():
+    # Non-breaking and other Unicode whitespaces are cleared like the ASCII ones
+    record = Record("John", phones=["(111)\xa0222 33-44"])
+
+    assert record.find_phone("111 222 33 44").value == "1112223344"
+
+
+def test_remove_phone():
+    record = Record("John", phones=["1111111111", "2222222222", "3333333333"])
+    phones = record.phones
+
+    record.remove_phone("(222) 222 22-22")
+
+    assert list(phones) == ["1111111111", "3333333333"]
+    with pytest.raises(ContactPhoneNotFound):
+        record.remove_phone("2222222222")
+
+
+def test_remove_email():
+    record = Record("John", emails=["a@test.com", "b@test.com", "c@test.com"])
+
+    record.remove_email(" b@test.com ")
+
+    assert list(record.emails) == ["a@test.com", "c@test.com"]
+    with pytest.raises(ContactEmailNotFound):
+        record.remove_email("b@test.com")
+
+
+def test_edit_phone():
+    record = Record("John", phones=["1111111111", "2222222222", "3333333333"])
+    phones = record.phones
+
+    # The changed phone number is moved to the end and the dictionary is updated in place
+    record.edit_phone("2222222222", "4444444444")
+    assert record.phones is phones
+    assert list(phones) == ["1111111111", "3333333333", "4444444444"]
+
+    # The same phone number in another format keeps its position
+    record.edit_phone("1111111111", "(111) 111 11-11")
+    assert list(phones) == ["1111111111", "3333333333", "4444444444"]
+
+    with pytest.raises(ContactPhoneNotFound):
+        record.edit_phone("2222222222", "5555555555")
+    with pytest.raises(ContactPhoneAlreadyExist):
+        record.edit_phone("4444444444", "111-111-1111")
+    assert list(phones) == ["1111111111", "3333333333", "4444444444"]
+
+
+def test_edit_email():
+    record = Record("John", emails=["a@test.com", "b@test.com", "c@test.com"])
+    emails = record.emails
+
+    # The changed email is moved to the end and the dictionary is updated in place
+    record.edit_email("b@test.com", "d@test.com")
+    assert record.emails is emails
+    assert list(emails) == ["a@test.com", "c@test.com", "d@test.com"]
+
+    with pytest.raises(ContactEmailNotFound):
+        record.edit_email("b@test.com", "e@test.com")
+    with pytest.raises(ContactEmailAlreadyExist):
+        record.edit_email("d@test.com", "a@test.com")
+    assert list(emails) == ["a@test.com", "c@test.com", "d@test.com"]
+
+
+@pytest.mark.parametrize("phone", [
+    "12345",
+    "12345678901",
+    "12345abcde",
+    "123456789\u00b2",
+    "123456789\u0660",
+    "\uff11\uff12\uff13\uff14\uff15\uff16\uff17\uff18\uff19\uff10",
+])
+def test_phone_value_error(phone):
+    # Letters, superscripts and non-ASCII digits are not valid phone number digits
+    with pytest.raises(ContactPhoneValueError):
+        Record("John", phones=[phone])
 
-        # Print all records in the address book
-        for name, record in book.data.items():
-            print(record)
 
-    except Exception as e:
-        print(e)
+def test_email_whitespace():
+    record = Record("John", emails=[" john @ test.com\n"])
 
-    exit(0)
+    assert list(record.emails) == ["john@test.com"]
 
 
-if __name__ == "__main__":
-    main()
+@pytest.mark.parametrize("email", [
+    "john@test",
+    "john.test.com",
+    "john@test.com@test.com",
+    "john@test.com!",
+    "j\u00f6hn@test.com",
+])
+def test_email_value_error(email):
+    with pytest.raises(ContactEmailValueError):
+        Record("John", emails=[email])